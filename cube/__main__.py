@@ -10,26 +10,68 @@ from asciimatics.screen import ManagedScreen, Screen
 
 from . import rotation
 from .artist import DISTANCE_TO_CAMERA, Artist
-from .cube import Cube
+from .cube import CubeStore
 from .data_structures import KeyboardCommand
 from .help import BRIEF_HELP_TEXT, show_help
 
 logging.basicConfig(level=logging.INFO, filename="cube.log")
 log = logging.getLogger()
 
-
-def rotate_face(face: np.array, axis: str, clockwise: bool) -> None:
-    """Rotate a face of the cube."""
-    direction = 1 if clockwise else -1
-
-    rotate = getattr(Cube, "rotate_" + axis)
-    for cube in face.flatten():
-        rotate(cube, direction * np.pi / 2)
-
-    if axis == "z":
-        direction *= -1
-
-    face[:] = np.rot90(face, -direction)
+# directions the faces of the Rubik cube point to, shared by every frame and never to be modified
+DIR_RIGHT = np.array([1.0, 0, 0])
+DIR_LEFT = np.array([-1.0, 0, 0])
+DIR_TOP = np.array([0, 1.0, 0])
+DIR_BOTTOM = np.array([0, -1.0, 0])
+DIR_FRONT = np.array([0, 0, 1.0])
+DIR_BACK = np.array([0, 0, -1.0])
+for _direction in (DIR_RIGHT, DIR_LEFT, DIR_TOP, DIR_BOTTOM, DIR_FRONT, DIR_BACK):
+    _direction.setflags(write=False)
+
+# positions in the flattened rubik_cube array, to pick the cubes of each layer in reading order
+_CUBE_INDEX = np.arange(27).reshape(3, 3, 3)
+
+# how to draw the net of the cube: label, direction the face points to,
+# cubes in that layer, and offset of the top left corner from the bottom right of the screen
+NET_FACES = (
+    ("T", DIR_TOP, _CUBE_INDEX[::-1, 0].T.flatten()[::-1], (6, 12)),
+    ("F", DIR_FRONT, _CUBE_INDEX[:, :, 0].T.flatten(), (6, 9)),
+    ("D", DIR_BOTTOM, _CUBE_INDEX[:, 2].T.flatten(), (6, 6)),
+    ("B", DIR_BACK, _CUBE_INDEX[::-1, :, 2].T.flatten()[::-1], (6, 3)),
+    ("L", DIR_LEFT, _CUBE_INDEX[0, ::-1].flatten()[::-1], (9, 9)),
+    ("R", DIR_RIGHT, _CUBE_INDEX[2].flatten(), (3, 9)),
+)
+
+# which disc each key rotates: index of the disc in the Rubik cube, rotation axis, clockwise
+KEY_TO_FACE = {
+    KeyboardCommand.rotate_front_ccw: (np.s_[:, :, 0], "z", False),
+    KeyboardCommand.rotate_front_cw: (np.s_[:, :, 0], "z", True),
+    KeyboardCommand.rotate_middle_ccw: (np.s_[:, :, 1], "z", False),
+    KeyboardCommand.rotate_middle_cw: (np.s_[:, :, 1], "z", True),
+    KeyboardCommand.rotate_back_ccw: (np.s_[:, :, 2], "z", False),
+    KeyboardCommand.rotate_back_cw: (np.s_[:, :, 2], "z", True),
+    KeyboardCommand.rotate_top_ccw: (np.s_[:, 0], "y", False),
+    KeyboardCommand.rotate_top_cw: (np.s_[:, 0], "y", True),
+    KeyboardCommand.rotate_bottom_ccw: (np.s_[:, 2], "y", False),
+    KeyboardCommand.rotate_bottom_cw: (np.s_[:, 2], "y", True),
+    KeyboardCommand.rotate_left_ccw: (np.s_[0], "x", False),
+    KeyboardCommand.rotate_left_cw: (np.s_[0], "x", True),
+    KeyboardCommand.rotate_right_ccw: (np.s_[2], "x", False),
+    KeyboardCommand.rotate_right_cw: (np.s_[2], "x", True),
+}
+
+
+# how far np.rot90 has to turn a disc to keep track of its cubes, keyed by (axis, clockwise)
+DISC_TURNS = {
+    (axis, clockwise): (1 if clockwise else -1) * (1 if axis == "z" else -1)
+    for axis in ("x", "y", "z")
+    for clockwise in (True, False)
+}
+
+
+def rotate_face(cube_store: CubeStore, face: np.array, axis: str, clockwise: bool) -> None:
+    """Rotate a face of the cube, given as the indices of its cubes in cube_store."""
+    cube_store.rotate(face.ravel(), rotation.QUARTER_TURNS[axis, clockwise])
+    face[:] = np.rot90(face, DISC_TURNS[axis, clockwise])
 
 
 @ManagedScreen
@@ -38,14 +80,9 @@ def main_event_loop(screen: Screen = None) -> None:
     # create an artist to draw the individual cubes
     artist = Artist(screen)
 
-    # the Rubik cube is made up of 27 individual cubes
-    rubik_cube = np.array(
-        [
-            Cube(np.array(coord))
-            for coord in product((-1, 0, 1), (1, 0, -1), (1, 0, -1))
-        ],
-        dtype=object,
-    ).reshape(3, 3, 3)
+    # the Rubik cube is made up of 27 individual cubes, and tracks where each of them is in cube_store
+    cube_store = CubeStore(list(product((-1, 0, 1), (1, 0, -1), (1, 0, -1))))
+    rubik_cube = np.arange(len(cube_store)).reshape(3, 3, 3)
 
     # DEBUG: restrict to 2 cubes for easier troubleshooting:
     # rubik_cube = [rubik_cube[0], rubik_cube[-1]]
@@ -56,87 +93,67 @@ def main_event_loop(screen: Screen = None) -> None:
     camera_2d = np.array([0, 0])
     start_pos = np.array([0, 0])
     auto_mouse = True
+    # only redraw the screen when something has changed
+    dirty = True
 
     while True:
-        ev = screen.get_event()
-        if isinstance(ev, KeyboardEvent):
-            key = ev.key_code
-            # Stop on ctrl+q or ctrl+x, or simply on q/Q
-            if key == KeyboardCommand.quit:
-                # raise StopApplication("User terminated app")
-                return
-            elif (
-                key == KeyboardCommand.rotate_front_ccw
-            ):  # rotate front disc counter-clockwise
-                rotate_face(face=rubik_cube[:, :, 0], axis="z", clockwise=False)
-            elif key == KeyboardCommand.rotate_front_cw:  # rotate front disc clockwise
-                rotate_face(face=rubik_cube[:, :, 0], axis="z", clockwise=True)
-            elif key == KeyboardCommand.rotate_top_cw:  # rotate top disc clockwise
-                rotate_face(face=rubik_cube[:, 0], axis="y", clockwise=True)
-            elif (
-                key == KeyboardCommand.rotate_top_ccw
-            ):  # rotate top disc counter-clockwise
-                rotate_face(face=rubik_cube[:, 0], axis="y", clockwise=False)
-            elif (
-                key == KeyboardCommand.rotate_middle_ccw
-            ):  # rotate middle disk counter-clockwise
-                rotate_face(face=rubik_cube[:, :, 1], axis="z", clockwise=False)
-            elif key == KeyboardCommand.rotate_middle_cw:
-                rotate_face(face=rubik_cube[:, :, 1], axis="z", clockwise=True)
-            elif (
-                key == KeyboardCommand.rotate_back_ccw
-            ):  # rotate back disk counter-clockwise
-                rotate_face(face=rubik_cube[:, :, 2], axis="z", clockwise=False)
-            elif key == KeyboardCommand.rotate_back_cw:  # rotate back disk clockwise
-                rotate_face(face=rubik_cube[:, :, 2], axis="z", clockwise=True)
-            elif key == KeyboardCommand.rotate_bottom_ccw:
-                rotate_face(face=rubik_cube[:, 2], axis="y", clockwise=False)
-            elif key == KeyboardCommand.rotate_bottom_cw:
-                rotate_face(face=rubik_cube[:, 2], axis="y", clockwise=True)
-            elif key == KeyboardCommand.rotate_left_ccw:
-                rotate_face(face=rubik_cube[0], axis="x", clockwise=False)
-            elif key == KeyboardCommand.rotate_left_cw:
-                rotate_face(face=rubik_cube[0], axis="x", clockwise=True)
-            elif key == KeyboardCommand.rotate_right_ccw:
-                rotate_face(face=rubik_cube[2], axis="x", clockwise=False)
-            elif key == KeyboardCommand.rotate_right_cw:
-                rotate_face(face=rubik_cube[2], axis="x", clockwise=True)
-            elif key == KeyboardCommand.reset_view:
-                artist.set_initial_camera()
-            elif key == KeyboardCommand.help:
-                # could show a widget here that explains usage and
-                # keys, then waits for key press
-                show_help(screen, log)
-        elif isinstance(ev, MouseEvent):
-            mouse_x, mouse_y, mouse_buttons = ev.x, ev.y, ev.buttons
-            if mouse_buttons:
-                auto_mouse = not auto_mouse
-                log.info("setting mouse to %s, mouse event is %s", auto_mouse, ev)
-                start_pos = np.array([mouse_x, mouse_y])
-
-            elif auto_mouse:
-                end_pos = np.array([mouse_x, mouse_y])
-
-                camera_2d += end_pos - start_pos
-                camera_2d_normalised = camera_2d / (screen.width, screen.height) * np.pi
-                alpha, beta = camera_2d_normalised
-
-                R = rotation.Ry(alpha) @ rotation.Rx(beta)
-                camera_x = (R @ np.array([1, 0, 0])).flatten()
-                camera_y = (R @ np.array([0, 1, 0])).flatten()
-                camera_z = -(R @ np.array([0, 0, 1])).flatten()
-
-                artist.camera_position = -camera_z * DISTANCE_TO_CAMERA
-                artist.camera_x = camera_x
-                artist.camera_y = camera_y
-                artist.camera_z = camera_z
-
-                start_pos = end_pos
-
-            else:
-                log.info(
-                    "not registering mouse movement because auto-mouse has been disabled."
-                )
+        # handle all pending events, but update the camera at most once
+        camera_moved = False
+        while (ev := screen.get_event()) is not None:
+            # every event changes the cube, the camera or the status line
+            dirty = True
+            if isinstance(ev, KeyboardEvent):
+                key = ev.key_code
+                # Stop on ctrl+q or ctrl+x, or simply on q/Q
+                if key == KeyboardCommand.quit:
+                    # raise StopApplication("User terminated app")
+                    return
+                elif key in KEY_TO_FACE:
+                    disc, axis, clockwise = KEY_TO_FACE[key]
+                    rotate_face(cube_store, face=rubik_cube[disc], axis=axis, clockwise=clockwise)
+                elif key == KeyboardCommand.reset_view:
+                    artist.set_initial_camera()
+                    camera_moved = False
+                elif key == KeyboardCommand.help:
+                    # could show a widget here that explains usage and
+                    # keys, then waits for key press
+                    show_help(screen, log)
+            elif isinstance(ev, MouseEvent):
+                mouse_x, mouse_y, mouse_buttons = ev.x, ev.y, ev.buttons
+                if mouse_buttons:
+                    auto_mouse = not auto_mouse
+                    log.info("setting mouse to %s, mouse event is %s", auto_mouse, ev)
+                    start_pos = np.array([mouse_x, mouse_y])
+
+                elif auto_mouse:
+                    end_pos = np.array([mouse_x, mouse_y])
+
+                    camera_2d += end_pos - start_pos
+                    camera_moved = True
+
+                    start_pos = end_pos
+
+                else:
+                    log.info(
+                        "not registering mouse movement because auto-mouse has been disabled."
+                    )
+
+        if camera_moved:
+            camera_2d_normalised = camera_2d / (screen.width, screen.height) * np.pi
+            alpha, beta = camera_2d_normalised.tolist()
+
+            R = rotation.Ry(alpha) @ rotation.Rx(beta)
+            # R @ e_i is just the i-th column of R
+            artist.camera_position = R[:, 2] * DISTANCE_TO_CAMERA
+            artist.camera_x = R[:, 0]
+            artist.camera_y = R[:, 1]
+            artist.camera_z = -R[:, 2]
+
+        if screen.has_resized():
+            dirty = True
+        if not dirty:
+            time.sleep(0.01)
+            continue
 
         current_time = time.time_ns()
         if not current_time == last_time:
@@ -154,98 +171,22 @@ def main_event_loop(screen: Screen = None) -> None:
         )
         screen.print_at(BRIEF_HELP_TEXT, 0, 3)
 
-        def cube_camera_distance(cube: Cube) -> np.float32:
-            """Return distance of cube centre point to the camera."""
-            return np.linalg.norm(artist.camera_position - cube.position)
-
         # draw each individual cube, start with those furthest away from the camera:
-        for cube in sorted(
-            rubik_cube.flatten(), key=cube_camera_distance, reverse=True
-        ):
-            cube.draw_block_faces(artist)
-            cube.draw_cage(artist)
-
-        # these are the cubes in the top layer:
-        top_layer = rubik_cube[::-1, 0].T.flatten()[::-1]
-        top_colours = [
-            cube.get_face_colour(np.array([0, 1, 0])) for cube in top_layer
-        ]  # [0,1,0] is the direction pointing up
-        # screen.print_at(f"{top_colours=}",0,5)
-        for i, c in enumerate(top_colours):
-            screen.print_at(
-                "T",
-                screen.width - 6 + (i % 3),
-                screen.height - 12 + (i // 3),
-                c,
-            )
-        # these are the cubes in the front layer:
-        front_layer = rubik_cube[:, :, 0].T.flatten()
-        front_colours = [
-            cube.get_face_colour(np.array([0, 0, 1])) for cube in front_layer
-        ]
-        # screen.print_at(f"{front_colours=}",0,6)
-        for i, c in enumerate(front_colours):
-            screen.print_at(
-                "F",
-                screen.width - 6 + (i % 3),
-                screen.height - 9 + (i // 3),
-                c,
-            )
-        # these are the cubes in the bottom layer:
-        bottom_layer = rubik_cube[:, 2].T.flatten()
-        bottom_colours = [
-            cube.get_face_colour(np.array([0, -1, 0])) for cube in bottom_layer
-        ]
-        # screen.print_at(f"{bottom_colours=}",0,6)
-        for i, c in enumerate(bottom_colours):
-            screen.print_at(
-                "D",
-                screen.width - 6 + (i % 3),
-                screen.height - 6 + (i // 3),
-                c,
-            )
-        # these are the cubes in the rear layer:
-        rear_layer = rubik_cube[::-1, :, 2].T.flatten()[::-1]
-        rear_colours = [
-            cube.get_face_colour(np.array([0, 0, -1])) for cube in rear_layer
-        ]
-        # screen.print_at(f"{rear_colours=}",0,6)
-        for i, c in enumerate(rear_colours):
-            screen.print_at(
-                "B",
-                screen.width - 6 + (i % 3),
-                screen.height - 3 + (i // 3),
-                c,
-            )
-
-        # these are the cubes in the left layer:
-        left_layer = rubik_cube[0, ::-1].flatten()[::-1]
-        left_colours = [
-            cube.get_face_colour(np.array([-1, 0, 0])) for cube in left_layer
-        ]
-        # screen.print_at(f"{left_colours=}",0,6)
-        for i, c in enumerate(left_colours):
-            screen.print_at(
-                "L",
-                screen.width - 9 + (i % 3),
-                screen.height - 9 + (i // 3),
-                c,
-            )
-        # these are the cubes in the right layer:
-        right_layer = rubik_cube[2].flatten()
-        right_colours = [
-            cube.get_face_colour(np.array([1, 0, 0])) for cube in right_layer
-        ]
-        # screen.print_at(f"{right_colours=}",0,6)
-        for i, c in enumerate(right_colours):
-            screen.print_at(
-                "R",
-                screen.width - 3 + (i % 3),
-                screen.height - 9 + (i // 3),
-                c,
-            )
+        cube_store.draw(artist)
+
+        # draw the net of the cube in the bottom right corner:
+        indices = rubik_cube.ravel()
+        for label, direction, layer, (dx, dy) in NET_FACES:
+            for i, c in enumerate(cube_store.face_colours(indices[layer], direction)):
+                screen.print_at(
+                    label,
+                    screen.width - dx + (i % 3),
+                    screen.height - dy + (i // 3),
+                    c,
+                )
 
         screen.refresh()
+        dirty = False
 
 
 main_event_loop()
@@ -1,3 +1,4 @@
+import math
 from typing import List
 
 import numpy as np
@@ -5,6 +6,11 @@ from asciimatics.screen import Screen
 
 from . import rotation
 
+try:
+    from numba import njit
+except ImportError:  # fall back to plain NumPy if numba is not installed
+    njit = None
+
 DISTANCE_TO_CAMERA = 6
 
 
@@ -35,29 +41,29 @@ class Artist:
 
     def set_initial_camera(self) -> None:
         """Set or reset the artist camera to the initial phase, at the diagonal above cube."""
-        R = rotation.Ry(30 / 180 * np.pi) @ rotation.Rx(30 / 180 * np.pi)
+        R = rotation.Ry(math.radians(30)) @ rotation.Rx(math.radians(30))
 
-        self.camera_position = (R @ np.array([0, 0, DISTANCE_TO_CAMERA])).flatten()
-        self.camera_x = (R @ np.array([1, 0, 0])).flatten()  # "what is right"
-        self.camera_y = (R @ np.array([0, 1, 0])).flatten()  # "what is up"
-        self.camera_z = -(R @ np.array([0, 0, 1])).flatten()
+        # R @ e_i is just the i-th column of R
+        self.camera_position = R[:, 2] * DISTANCE_TO_CAMERA
+        self.camera_x = R[:, 0]  # "what is right"
+        self.camera_y = R[:, 1]  # "what is up"
+        self.camera_z = -R[:, 2]
 
-    def line(self, pt1: np.array, pt2: np.array) -> None:
-        """Draw a line from pt1 to pt2."""
-        self.screen.move(*self.project3d(pt1))
-        self.screen.draw(*self.project3d(pt2))
+    def line2d(self, pt1: np.array, pt2: np.array) -> None:
+        """Draw a line from pt1 to pt2, which are already projected to 2D."""
+        self.screen.move(*pt1)
+        self.screen.draw(*pt2)
 
-    def fill_polygon(self, polygons: List[List[np.array]], colour: int) -> None:
-        """Draw a filled polygon of the given colour. Coordinates are 3D."""
-        self.screen.fill_polygon(
-            [[self.project3d(pt) for pt in poly] for poly in polygons], colour
-        )
+    def fill_polygon2d(self, polygons: List[np.array], colour: int) -> None:
+        """Draw a filled polygon of the given colour. Coordinates are already projected to 2D."""
+        # asciimatics works point by point, which is much faster on Python floats than on NumPy arrays
+        self.screen.fill_polygon([np.asarray(poly).tolist() for poly in polygons], colour)
 
     # 3d to 2d projection
-    def project3d(self, point: np.array) -> np.array:
-        """Project a point in 3 space onto 2D coordinates for screen.
+    def project3d(self, points: np.array) -> np.array:
+        """Project an (N, 3) array of points in 3 space onto (N, 2) 2D coordinates for screen.
 
-        Take a 3D point and project it into 2D to draw it, by using a
+        Take 3D points and project them into 2D to draw them, by using a
         camera given via its position vector and a "camera coordinate
         system": The vector camera_z is (the unit vector) where the camera
         is pointed (say toward the scene, which may be centered about the
@@ -65,14 +71,58 @@ class Artist:
         is "to the right" and "up". They should be orthogonal, and
         camera_z their (negative) cross-product.
         """
-        camera_position = self.camera_position
-        camera_z = self.camera_z
+        out = np.empty((len(points), 2))
+
+        if _project is not None:
+            _project(
+                np.asarray(points, dtype=np.float64),
+                self.camera_position,
+                self.camera_x,
+                self.camera_y,
+                self.camera_z,
+                self.cx,
+                self.cy,
+                out,
+            )
+            return out
 
-        P = (
-            1 / camera_z.dot(point - camera_position) * (point - camera_position)
-            + camera_position
-        )
-
-        x, y = P.dot(self.camera_x), P.dot(self.camera_y)
+        camera_position = self.camera_position
 
-        return np.array([self.cx * (1 + x), self.cy * (1 - y)])
+        d = points - camera_position
+        t = 1 / (d @ self.camera_z)
+        P = d * t[:, None] + camera_position
+
+        xy = P @ np.stack([self.camera_x, self.camera_y], axis=1)
+
+        out[:, 0] = self.cx * (1 + xy[:, 0])
+        out[:, 1] = self.cy * (1 - xy[:, 1])
+        return out
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _project(
+        points: np.array,
+        camera_position: np.array,
+        camera_x: np.array,
+        camera_y: np.array,
+        camera_z: np.array,
+        cx: float,
+        cy: float,
+        out: np.array,
+    ) -> None:
+        """Compiled kernel for Artist.project3d, writing the projection of points into out."""
+        for i in range(points.shape[0]):
+            d0 = points[i, 0] - camera_position[0]
+            d1 = points[i, 1] - camera_position[1]
+            d2 = points[i, 2] - camera_position[2]
+            t = 1 / (d0 * camera_z[0] + d1 * camera_z[1] + d2 * camera_z[2])
+            p0 = d0 * t + camera_position[0]
+            p1 = d1 * t + camera_position[1]
+            p2 = d2 * t + camera_position[2]
+            out[i, 0] = cx * (1 + p0 * camera_x[0] + p1 * camera_x[1] + p2 * camera_x[2])
+            out[i, 1] = cy * (1 - p0 * camera_y[0] - p1 * camera_y[1] - p2 * camera_y[2])
+
+else:
+    _project = None
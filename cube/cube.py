@@ -1,174 +1,135 @@
+from typing import List, Sequence
+
 import numpy as np
 from asciimatics.screen import Screen
 
-from . import rotation
 from .artist import Artist
 
-
-class Cube:
-    """A 1x1x1 cube."""
-
-    __slots__ = ("front", "back", "normal_vectors", "colours", "position")
-
-    def __init__(self, position: np.array = np.array([0, 0, 0])):
-        self.position = position
-
-        # define corner points of front face and back face, starting in top left, going clockwise
-        front = [
-            np.array(
-                [-1, 1, 1]
-            ),  # (x,y,z) coordinates of each point, z is 1 for all front points
-            np.array([1, 1, 1]),
-            np.array([1, -1, 1]),
-            np.array([-1, -1, 1]),
-        ]
-
-        back = [
-            np.array([-1, 1, -1]),
-            np.array([1, 1, -1]),
-            np.array([1, -1, -1]),
-            np.array([-1, -1, -1]),
-        ]
-
-        self.front = [
-            pt / 2 + position for pt in front
-        ]  # make the cubes side lengths equal to one
-        self.back = [pt / 2 + position for pt in back]
-
-        self.normal_vectors = {
-            "front": [0, 0, 1],
-            "back": [0, 0, -1],
-            "left": [-1, 0, 0],
-            "right": [1, 0, 0],
-            "top": [0, 1, 0],
-            "bottom": [0, -1, 0],
-        }
-
-        # taking colours from here:
-        # https://en.wikipedia.org/wiki/Rubik%27s_Cube#/media/File:Rubik's_cube_colors.svg
-        self.colours = {
-            "front": Screen.COLOUR_RED,
-            "back": Screen.COLOUR_MAGENTA,  # there's no orange, unfortunately
-            "left": Screen.COLOUR_YELLOW,
-            "right": Screen.COLOUR_WHITE,
-            "top": Screen.COLOUR_GREEN,
-            "bottom": Screen.COLOUR_BLUE,
-        }
-
-    def draw_cage(self, artist: Artist) -> None:
-        """Draw self as wireframe using artist."""
-        if artist.camera_position[0] == 0:  # only draw for the initial face
-            for pt1, pt2 in zip(self.front, [*self.front[1:], self.front[0]]):
-                artist.line(pt1, pt2)
-            for pt1, pt2 in zip(self.back, [*self.back[1:], self.back[0]]):
-                artist.line(pt1, pt2)
-            for pt1, pt2 in zip(self.front, self.back):
-                artist.line(pt1, pt2)
-
-    def draw_block_faces(self, artist: Artist) -> None:
-        """Draw self with solid colored faces using artist."""
-        camera_direction = artist.camera_position
-
-        # front
-        if np.inner(camera_direction, self.normal_vectors["front"]) > 0:
-            artist.fill_polygon(
-                [
-                    self.front,
-                ],
-                self.colours["front"],
-            )
-        # back
-        if np.inner(camera_direction, self.normal_vectors["back"]) > 0:
-            artist.fill_polygon(
-                [
-                    self.back[::-1],
-                ],
-                self.colours["back"],
-            )
-        # left
-        if np.inner(camera_direction, self.normal_vectors["left"]) > 0:
-            artist.fill_polygon(
-                [
-                    [
-                        self.front[0],
-                        self.back[0],
-                        self.back[3],
-                        self.front[3],
-                    ]
-                ],
-                self.colours["left"],
-            )
-        # right
-        if np.inner(camera_direction, self.normal_vectors["right"]) > 0:
-            artist.fill_polygon(
-                [
-                    [
-                        self.front[1],
-                        self.front[2],
-                        self.back[2],
-                        self.back[1],
-                    ]
-                ],
-                self.colours["right"],
-            )
-        # top
-        if np.inner(camera_direction, self.normal_vectors["top"]) > 0:
-            artist.fill_polygon(
-                [
-                    [
-                        self.front[0],
-                        self.front[1],
-                        self.back[1],
-                        self.back[0],
-                    ]
-                ],
-                self.colours["top"],
-            )
-        # bottom
-        if np.inner(camera_direction, self.normal_vectors["bottom"]) > 0:
-            artist.fill_polygon(
-                [
-                    [
-                        self.front[2],
-                        self.front[3],
-                        self.back[3],
-                        self.back[2],
-                    ]
-                ],
-                self.colours["bottom"],
-            )
-
-    def get_face_colour(self, face_normal: np.array) -> int:
-        """Determine the colour of a particular face."""
-        # list of faces and how well they align with the given face_normal:
-        face_list = [
-            (face, np.inner(face_normal, normal))
-            for face, normal in self.normal_vectors.items()
-        ]
-        # sort the list by alignment, pick the largest, return the corresponding face colour
-        return self.colours[sorted(face_list, key=lambda x: x[1], reverse=True)[0][0]]
-
-    def __rotation_update__(self, R: np.matrix) -> None:
-        """Multiply each point in this object by rotation matrix R."""
-        self.front = [R.dot(pt).flatten() for pt in self.front]
-        self.back = [R.dot(pt).flatten() for pt in self.back]
-        self.position = R.dot(self.position).flatten()
-        self.normal_vectors = {
-            face: R.dot(normal).flatten()
-            for face, normal in self.normal_vectors.items()
-        }
-
-    def rotate_x(self, theta: np.float32) -> None:
-        """Rotate entire object around x axis by angle theta [radians]."""
-        R = rotation.Rx(theta)
-        self.__rotation_update__(R)
-
-    def rotate_y(self, theta: np.float32) -> None:
-        """Rotate entire object around z axis by angle theta [radians]."""
-        R = rotation.Ry(theta)
-        self.__rotation_update__(R)
-
-    def rotate_z(self, theta: np.float32) -> None:
-        """Rotate entire object around z axis by angle theta [radians]."""
-        R = rotation.Rz(theta)
-        self.__rotation_update__(R)
+# one colour per face, and every per-face table follows the same order: front, back, left, right, top, bottom
+# taking colours from here:
+# https://en.wikipedia.org/wiki/Rubik%27s_Cube#/media/File:Rubik's_cube_colors.svg
+FACE_COLOURS = (
+    Screen.COLOUR_RED,  # front
+    Screen.COLOUR_MAGENTA,  # back, there's no orange, unfortunately
+    Screen.COLOUR_YELLOW,  # left
+    Screen.COLOUR_WHITE,  # right
+    Screen.COLOUR_GREEN,  # top
+    Screen.COLOUR_BLUE,  # bottom
+)
+
+# rows of CubeStore.BASE_VERTS making up each face, in drawing order, one row per face of FACE_COLOURS
+FACE_VERTS = np.array(
+    [
+        [0, 1, 2, 3],  # front
+        [7, 6, 5, 4],  # back
+        [0, 4, 7, 3],  # left
+        [1, 2, 6, 5],  # right
+        [0, 1, 5, 4],  # top
+        [2, 3, 7, 6],  # bottom
+    ],
+    dtype=np.intp,
+)
+FACE_VERTS.setflags(write=False)
+
+# pairs of rows of CubeStore.BASE_VERTS joined by an edge: front face, back face, then front to back
+CAGE_EDGES = np.array(
+    [
+        [0, 1],
+        [1, 2],
+        [2, 3],
+        [3, 0],
+        [4, 5],
+        [5, 6],
+        [6, 7],
+        [7, 4],
+        [0, 4],
+        [1, 5],
+        [2, 6],
+        [3, 7],
+    ],
+    dtype=np.intp,
+)
+CAGE_EDGES.setflags(write=False)
+
+
+class CubeStore:
+    """The state of many 1x1x1 cubes, kept in stacked arrays with one row per cube."""
+
+    __slots__ = ("verts", "normals", "positions")
+
+    # corner points of front face and back face, starting in top left, going clockwise,
+    # for a cube with side lengths equal to one centred at the origin
+    BASE_VERTS = (
+        np.array(
+            [
+                [-1, 1, 1],  # (x,y,z) coordinates of each point, z is 1 for all front points
+                [1, 1, 1],
+                [1, -1, 1],
+                [-1, -1, 1],
+                [-1, 1, -1],  # z is -1 for all back points
+                [1, 1, -1],
+                [1, -1, -1],
+                [-1, -1, -1],
+            ],
+            dtype=np.float64,
+        )
+        / 2
+    )
+    BASE_VERTS.setflags(write=False)
+
+    # one row per face of FACE_COLOURS
+    BASE_NORMALS = np.array(
+        [
+            [0, 0, 1],
+            [0, 0, -1],
+            [-1, 0, 0],
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, -1, 0],
+        ],
+        dtype=np.float64,
+    )
+    BASE_NORMALS.setflags(write=False)
+
+    def __init__(self, positions: np.array):
+        self.positions = np.array(positions, dtype=np.float64)
+        self.verts = self.BASE_VERTS + self.positions[:, np.newaxis, :]
+        self.normals = np.repeat(self.BASE_NORMALS[np.newaxis], len(self.positions), axis=0)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def rotate(self, indices: Sequence[int], R: np.array) -> None:
+        """Multiply each point in the cubes at indices by rotation matrix R."""
+        # points are stored as rows, so rotate them by multiplying with R.T from the right
+        Rt = R.T
+        self.verts[indices] = self.verts[indices] @ Rt
+        self.normals[indices] = self.normals[indices] @ Rt
+        self.positions[indices] = self.positions[indices] @ Rt
+
+    def draw_order(self, camera_position: np.array) -> np.array:
+        """Return the indices of all cubes, sorted from furthest to closest to the camera."""
+        offsets = self.positions - camera_position
+        # squared distances are good enough for sorting, no need for a square root
+        distances = np.einsum("ij,ij->i", offsets, offsets)
+        return np.argsort(-distances, kind="stable")
+
+    def draw(self, artist: Artist) -> None:
+        """Draw all cubes with solid coloured faces using artist, starting with those furthest from the camera."""
+        # project the corners of all cubes at once
+        projected = artist.project3d(self.verts.reshape(-1, 3)).reshape(self.verts.shape[:2] + (2,))
+        # only faces pointing towards the camera are visible
+        visible = self.normals @ artist.camera_position > 0
+
+        draw_cage = artist.camera_position[0] == 0  # only draw for the initial face
+        for index in self.draw_order(artist.camera_position):
+            corners = projected[index]
+            for i in np.flatnonzero(visible[index]):
+                artist.fill_polygon2d([corners[FACE_VERTS[i]]], FACE_COLOURS[i])
+            if draw_cage:
+                for pt1, pt2 in corners[CAGE_EDGES]:
+                    artist.line2d(pt1, pt2)
+
+    def face_colours(self, indices: Sequence[int], face_normal: np.array) -> List[int]:
+        """Determine the colour each of the cubes at indices shows in the direction of face_normal."""
+        return [FACE_COLOURS[i] for i in (self.normals[indices] @ face_normal).argmax(axis=1)]
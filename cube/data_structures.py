@@ -1,12 +1,64 @@
+import textwrap
 from enum import IntEnum
-from typing import NamedTuple
+from functools import lru_cache
+from importlib.abc import Traversable
+from typing import NamedTuple, Tuple
+
+# the largest page of help text handed to the text box at once, see split_pages
+MAX_PAGE_BYTES = 8192
+
+
+@lru_cache(maxsize=None)
+def split_pages(text: str, max_bytes: int = MAX_PAGE_BYTES) -> Tuple[str, ...]:
+    """Split text at paragraph boundaries into pages of at most max_bytes each.
+
+    A single paragraph that is longer than max_bytes gets a page of its own.
+    """
+    pages = []
+    page, page_bytes = [], 0
+    for paragraph in text.split("\n\n"):
+        paragraph_bytes = len(paragraph.encode("utf-8")) + 2  # including the separator
+        if page and page_bytes + paragraph_bytes > max_bytes:
+            pages.append("\n\n".join(page))
+            page, page_bytes = [], 0
+        page.append(paragraph)
+        page_bytes += paragraph_bytes
+    pages.append("\n\n".join(page))
+    return tuple(pages)
+
+
+@lru_cache(maxsize=None)
+def wrap_text(text: str, width: int) -> str:
+    """Wrap each line of text at word boundaries, so that no line is longer than width."""
+    # empty lines wrap to nothing, but they have to stay to keep the paragraphs apart
+    return "\n".join(wrapped for line in text.split("\n") for wrapped in textwrap.wrap(line, width) or [""])
 
 
 class HelpEntry(NamedTuple):
     """Helper class to hold help information and extract help from markdown files."""
 
     name: str
-    description: str
+    path: Traversable
+
+    @property
+    # entries are hashable tuples, so lru_cache can remember results per entry
+    @lru_cache(maxsize=None)
+    def description(self) -> str:
+        """Return the help text, which is only read from the markdown file when first needed."""
+        # decode in one go, the files use plain "\n" line endings, so there is nothing to translate
+        return self.path.read_bytes().decode("utf-8")
+
+    @property
+    # cached per entry, like description
+    @lru_cache(maxsize=None)
+    def rendered(self) -> str:
+        """Return the help text as shown in the help menu, headed by the entry name."""
+        return f"{self.name}::\n{self.description}"
+
+    @property
+    def pages(self) -> Tuple[str, ...]:
+        """Return the rendered help text, split into pages that are small enough to show quickly."""
+        return split_pages(self.rendered)
 
 
 class KeyboardCommand(IntEnum):
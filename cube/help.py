@@ -1,23 +1,28 @@
 import logging
-from pathlib import Path
-from typing import Callable
+from functools import partial
+from importlib import resources
+from typing import Optional, Tuple
 
 from asciimatics.exceptions import StopApplication
 from asciimatics.scene import Scene
 from asciimatics.screen import Screen
 from asciimatics.widgets import Button, Divider, Frame, Layout, TextBox
 
-from .data_structures import HelpEntry
+from .data_structures import HelpEntry, split_pages, wrap_text
 
-HELP = [
-    HelpEntry(name, Path(path).read_text())
-    for name, path in (
-        ("Overview", "docs/overview.md"),
-        ("Mouse Movements", "docs/mouse_movements.md"),
-        ("Keyboard Commands", "docs/keyboard_commands.md"),
-        ("More Info", "docs/more_info.md"),
+# the help documents are package data, so they are found however the package is installed
+DOCS = resources.files(__package__) / "docs"
+
+# a tuple, as the entries never change after import
+HELP = tuple(
+    HelpEntry(name, DOCS / filename)
+    for name, filename in (
+        ("Overview", "overview.md"),
+        ("Mouse Movements", "mouse_movements.md"),
+        ("Keyboard Commands", "keyboard_commands.md"),
+        ("More Info", "more_info.md"),
     )
-]
+)
 
 BRIEF_HELP_TEXT = """
  Rotate Front: f/F;
@@ -39,10 +44,13 @@ class HelpMenu(Frame):
     """The HelpMenu class to render and display a dynamic help menu."""
 
     def __init__(self, screen: Screen):
+        # the menu takes up two thirds of the screen in each direction
+        height, width = screen.height * 2 // 3, screen.width * 2 // 3
+
         super().__init__(
             screen,
-            screen.height * 2 // 3,
-            screen.width * 2 // 3,
+            height,
+            width,
             hover_focus=True,
             can_scroll=False,
             title="Robust Reindeers - Rubik's Cube Help",
@@ -50,52 +58,101 @@ class HelpMenu(Frame):
         self.palette["layout"] = (0, 0, 0)
 
         self._long_help_box = TextBox(
-            screen.height * 2 // 3 - 10,
+            height - 10,
             as_string=True,
-            line_wrap=True,
+            line_wrap=False,
             readonly=True,
         )
         self._long_help_box.custom_colour = "title"
-        self._long_help_box.value = HELP[0].description
+        self._shown_text = None
+
+        # long help texts are shown a page at a time
+        self._previous_page_button = Button("< Previous Page", self._previous_page)
+        self._next_page_button = Button("Next Page >", self._next_page)
+        self._pages = ()
+        self._page = 0
 
         layout = Layout([100], fill_frame=True)
         self.add_layout(layout)
         layout.add_widget(Divider())
 
-        for index, entry in enumerate(HELP):
-            button = Button(entry.name, self._button_wrapper(index))
+        for entry in HELP:
+            button = Button(entry.name, partial(self._show_entry, entry))
             layout.add_widget(button)
 
         layout.add_widget(Divider())
         layout.add_widget(self._long_help_box)
 
         layout.add_widget(Divider())
-        layout.add_widget(Button("Return to Game", self._quit))
+
+        navigation = Layout([1, 1, 1])
+        self.add_layout(navigation)
+        navigation.add_widget(self._previous_page_button, 0)
+        navigation.add_widget(Button("Return to Game", self._quit), 1)
+        navigation.add_widget(self._next_page_button, 2)
 
         self.should_quit = False
         self.fix()
 
-    def _button_wrapper(self, index: int) -> Callable[..., None]:
-        """Return a wrapper that will update the extended help menu when a button of this index is pressed."""
-
-        def wrapper() -> None:
-            help = HELP[index]
-            self._long_help_box.value = f"{help.name}::\n{help.description}"
-
-        return wrapper
+        # the text is wrapped once per page rather than by the text box, which can only do so mid-word;
+        # keep the last column free like the text box does, so the text never needs scrolling sideways
+        self._wrap_width = self._long_help_box.width - 1
+        self._show_pages(split_pages(HELP[0].description))
+
+    def reset(self) -> None:
+        """Reset the menu to show the overview again, every time it is opened."""
+        super().reset()
+        self._show_pages(split_pages(HELP[0].description))
+
+    def _show_entry(self, entry: HelpEntry) -> None:
+        """Update the extended help menu to show this help entry."""
+        self._show_pages(entry.pages)
+
+    def _show_pages(self, pages: Tuple[str, ...], page: int = 0) -> None:
+        """Show one of the pages in the extended help menu, and which pages there are to flip to."""
+        self._pages, self._page = pages, page
+        self._show_text(pages[page])
+        self._previous_page_button.disabled = page == 0
+        self._next_page_button.disabled = page == len(pages) - 1
+
+    def _previous_page(self) -> None:
+        """Flip to the previous page of the help text."""
+        if self._page > 0:
+            self._show_pages(self._pages, self._page - 1)
+
+    def _next_page(self) -> None:
+        """Flip to the next page of the help text."""
+        if self._page < len(self._pages) - 1:
+            self._show_pages(self._pages, self._page + 1)
+
+    def _show_text(self, text: str) -> None:
+        """Show text in the extended help menu, unless it is showing already."""
+        # the text box splits all of the text on every assignment
+        if text != self._shown_text:
+            self._long_help_box.value = wrap_text(text, self._wrap_width)
+            self._shown_text = text
 
     def _quit(self) -> None:
         """Quit the help session."""
         raise StopApplication("user quit")
 
 
+# the help scene, with the screen and size it was built for, see show_help
+_cached_scene: Optional[Tuple[Screen, Tuple[int, int], Scene]] = None
+
+
 def show_help(screen: Screen, log: logging.Logger) -> None:
     """Show the help session, respond to user input and return to the cube once the user clicks the Quit button."""
-    screen.clear_buffer(0, 0, 0)
-    screen.refresh()
+    global _cached_scene
+
+    # building the menu is expensive, so keep it around for as long as the screen and its size stay the same;
+    # the menu draws to the screen it was built with, so a reopened screen needs a new one
+    size = (screen.width, screen.height)
+    if _cached_scene is None or _cached_scene[0] is not screen or _cached_scene[1] != size:
+        _cached_scene = (screen, size, Scene([HelpMenu(screen)], -1, name="Help Menu"))
 
-    screen.play([Scene([HelpMenu(screen)], -1, name="Help Menu")])
+    # no need to clear the screen before or after: Screen.play clears it when the scene starts,
+    # and the main loop redraws everything after the key press that opened the help
+    screen.play([_cached_scene[2]])
 
-    log.info("got to the end")
-    screen.clear_buffer(0, 0, 0)
-    screen.refresh()
+    log.debug("got to the end")
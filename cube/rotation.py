@@ -1,34 +1,49 @@
+import math
+
 import numpy as np
 
 
 def Rx(theta: np.float32) -> np.array:
     """Rotation by theta around x axis."""
+    c, s = math.cos(theta), math.sin(theta)
     return np.array(
         [
             [1, 0, 0],
-            [0, np.cos(theta), np.sin(theta)],
-            [0, -np.sin(theta), np.cos(theta)],
+            [0, c, s],
+            [0, -s, c],
         ]
     )
 
 
 def Ry(theta: np.float32) -> np.array:
     """Rotation by theta around y axis."""
+    c, s = math.cos(theta), math.sin(theta)
     return np.array(
         [
-            [np.cos(theta), 0, -np.sin(theta)],
+            [c, 0, -s],
             [0, 1, 0],
-            [np.sin(theta), 0, np.cos(theta)],
+            [s, 0, c],
         ]
     )
 
 
 def Rz(theta: np.float32) -> np.array:
     """Rotation by theta around z axis."""
+    c, s = math.cos(theta), math.sin(theta)
     return np.array(
         [
-            [np.cos(theta), np.sin(theta), 0],
-            [-np.sin(theta), np.cos(theta), 0],
+            [c, s, 0],
+            [-s, c, 0],
             [0, 0, 1],
         ]
     )
+
+
+# the rotations used to turn a disc of the Rubik cube, keyed by (axis, clockwise)
+QUARTER_TURNS = {
+    (axis, clockwise): R((1 if clockwise else -1) * math.pi / 2)
+    for axis, R in (("x", Rx), ("y", Ry), ("z", Rz))
+    for clockwise in (True, False)
+}
+for _R in QUARTER_TURNS.values():
+    _R.setflags(write=False)